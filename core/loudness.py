@@ -9,6 +9,7 @@ Description:
     various normalization methods
 """
 
+import math
 import torch
 import pyloudnorm as pyln  # pip install pyloudnorm
 import torch
@@ -38,7 +39,7 @@ def lufs_normalization(
 
 
 def peak_normalization(audio, target_peak=0.9):
-    peak = torch.max(torch.abs(audio))
+    peak = torch.linalg.vector_norm(audio, ord=math.inf)
     scaling_factor = target_peak / peak
     normalized_audio = audio * scaling_factor
     return normalized_audio
@@ -16,8 +16,10 @@ from torch.optim import Adam
 
 def approximate_loudness_matching(audio, target_loudness=-14.0):
     rms = torch.sqrt(torch.mean(audio**2))
-    current_loudness = 20 * torch.log10(rms + 1e-6)
-    gain = 10 ** ((target_loudness - current_loudness) / 20.0)
+    # 10^((target - 20*log10(rms)) / 20) == 10^(target / 20) / rms, so stay in
+    # the linear domain and only convert the scalar target from dB
+    target_rms = 10 ** (target_loudness / 20.0)
+    gain = target_rms / (rms + 1e-6)
     return audio * gain
 
 
@@ -10,6 +10,7 @@ Description:
 """
 
 import os
+import math
 import torch, torchaudio
 import torch.nn.functional as F
 from pathlib import Path
@@ -115,51 +116,41 @@ class SignalProcessingConvolutionReverb:
         num_audio_channels, audio_length = audio.shape
         num_ir_channels, ir_length = ir.shape
 
-        # Normalize IR to prevent amplification
-        ir = ir / torch.max(torch.abs(ir)) if torch.max(torch.abs(ir)) > 0 else ir
-
-        # Initialize list to hold processed channels
-        processed_channels = []
-
-        # Apply convolution per channel
-        for channel in range(num_audio_channels):
-            # Get the current audio and IR channel
-            audio_channel = audio[channel].unsqueeze(0).unsqueeze(0)  # Shape: [1, 1, N]
-            ir_channel = (
-                ir[channel].flip(0).unsqueeze(0).unsqueeze(0)
-            )  # Reverse IR, Shape: [1, 1, M]
-
-            # Perform convolution
-            convolved = F.conv1d(
-                audio_channel, ir_channel, padding=ir_length - 1
-            )  # Shape: [1, 1, N + M -1]
-
-            # Remove batch and channel dimensions
-            convolved = convolved.squeeze(0).squeeze(0)  # Shape: [N + M -1]
-
-            # Trim convolved signal to original audio length
-            convolved = convolved[:audio_length]
-
-            # Normalize convolved signal to prevent clipping
-            max_val = torch.max(torch.abs(convolved))
-            if max_val > 0:
-                convolved = convolved / max_val
-
-            # Apply wet/dry mix
-            dry = 1 - wet_dry
-            wet = wet_dry
-            processed = dry * audio[channel] + wet * convolved
-
-            # Prevent clipping by normalizing if necessary
-            processed_max = torch.max(torch.abs(processed))
-            if processed_max > 1.0:
-                processed = processed / processed_max
-
-            # Append processed channel
-            processed_channels.append(processed)
-
-        # Stack channels back into a tensor
-        processed_audio = torch.stack(processed_channels)  # Shape: [2, N]
+        # Normalize IR to prevent amplification, clamp instead of branching
+        # on the peak so no device to host sync is needed
+        tiny = torch.finfo(ir.dtype).tiny
+        ir = ir / torch.linalg.vector_norm(ir, ord=math.inf).clamp_min(tiny)
+
+        # Convolve all channels in one grouped conv1d, one group per channel
+        audio_batch = audio.unsqueeze(0)  # Shape: [1, C, N]
+        # Reverse IR, Shape: [C, 1, M]
+        ir_kernels = ir[:num_audio_channels].flip(-1).unsqueeze(1)
+
+        # Perform convolution
+        convolved = F.conv1d(
+            audio_batch,
+            ir_kernels,
+            padding=ir_length - 1,
+            groups=num_audio_channels,
+        )  # Shape: [1, C, N + M -1]
+
+        # Remove batch dimension and trim to original audio length
+        convolved = convolved.squeeze(0)[:, :audio_length]  # Shape: [C, N]
+
+        # Normalize each convolved channel to prevent clipping
+        max_val = torch.linalg.vector_norm(convolved, ord=math.inf, dim=1, keepdim=True)
+        convolved = convolved / max_val.clamp_min(tiny)
+
+        # Apply wet/dry mix
+        dry = 1 - wet_dry
+        wet = wet_dry
+        processed_audio = dry * audio + wet * convolved
+
+        # Prevent clipping by normalizing each channel if necessary
+        processed_max = torch.linalg.vector_norm(
+            processed_audio, ord=math.inf, dim=1, keepdim=True
+        )
+        processed_audio = processed_audio / processed_max.clamp_min(1.0)
 
         return processed_audio
 
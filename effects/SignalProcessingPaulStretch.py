@@ -16,6 +16,7 @@ Description:
 import torch
 
 import math
+import functools
 from typing import Tuple, List, Dict
 
 from ..core.utilities import comfy_root_to_syspath
@@ -87,16 +88,7 @@ class SignalProcessingPaulStretch:
         displace_pos = (window_size * 0.5) / stretch_factor
 
         # Create custom window function as in original code
-        window = torch.pow(
-            1.0
-            - torch.pow(
-                torch.linspace(
-                    -1.0, 1.0, window_size, device=waveform.device, dtype=waveform.dtype
-                ),
-                2.0,
-            ),
-            1.25,
-        )
+        window = self.get_window(window_size, waveform.device, waveform.dtype)
 
         # Initialize old windowed buffer
         old_windowed_buf = torch.zeros(
@@ -127,7 +119,8 @@ class SignalProcessingPaulStretch:
                 * 2
                 * math.pi
             )
-            freqs = amplitudes * torch.exp(1j * phases)
+            # Build the spectrum from real magnitude/phase, no complex exp
+            freqs = torch.polar(amplitudes, phases)
 
             # Inverse FFT
             buf_ifft = torch.fft.irfft(freqs, n=window_size, dim=1)
@@ -161,6 +154,21 @@ class SignalProcessingPaulStretch:
         # Return as audio dictionary
         return audio_to_comfy_3d(output_tensor, sample_rate)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def get_window(
+        window_size: int, device: torch.device, dtype: torch.dtype
+    ) -> torch.Tensor:
+        # cached per (window_size, device, dtype), callers must not modify it
+        return torch.pow(
+            1.0
+            - torch.pow(
+                torch.linspace(-1.0, 1.0, window_size, device=device, dtype=dtype),
+                2.0,
+            ),
+            1.25,
+        )
+
     @staticmethod
     def optimize_windowsize(n: int) -> int:
 
@@ -84,20 +84,30 @@ class SignalProcessingPadSynth:
         )  # Random phases between 0 and 2pi
 
         # Define Gaussian profile function
-        def profile(fi: torch.Tensor, bwi: torch.Tensor) -> torch.Tensor:
+        def profile(fi: torch.Tensor, bwi: float) -> torch.Tensor:
             x = fi / bwi
             x_sq = x**2
             # Avoid computing exp(-x^2) for x_sq > 14.71280603
             mask = x_sq <= 14.71280603
             result = torch.zeros_like(x_sq)
-            result[mask] = torch.exp(-x_sq[mask]) / bwi[mask]
+            result[mask] = torch.exp(-x_sq[mask]) / bwi
             return result
 
+        # Half width of the profile support in units of bwi, sqrt(14.71280603)
+        profile_extent = math.sqrt(14.71280603)
+
         # Convert bandwidth from cents to Hz
         # bw_Hz = (2^(bw/1200) -1) * f * nh
         # Convert bandwidth_cents to multiplier
         bw_multiplier = 2.0 ** (bandwidth_cents / 1200.0) - 1.0
 
+        # Create tensors for frequency bins
+        i = torch.arange(N // 2, dtype=torch.double)
+        # Normalized frequency for each bin
+        normalized_freq = (
+            i / N
+        )  # Equivalent to i * (sample_rate / N) / sample_rate = i / N
+
         # Populate frequency amplitude array
         for nh in range(1, number_harmonics):
             f_nh = fundamental_freq * nh
@@ -105,33 +115,29 @@ class SignalProcessingPadSynth:
             bwi = bw_Hz / (2.0 * sample_rate)
             fi = f_nh / sample_rate  # Normalized frequency
 
-            # Create tensors for frequency bins
-            i = torch.arange(N // 2, dtype=torch.double)
-            # Normalized frequency for each bin
-            normalized_freq = (
-                i / N
-            )  # Equivalent to i * (sample_rate / N) / sample_rate = i / N
+            # The profile is zero outside |x| <= profile_extent, only evaluate
+            # it on the bins inside that band
+            lo = max(0, math.floor((fi - profile_extent * bwi) * N))
+            hi = min(N // 2, math.ceil((fi + profile_extent * bwi) * N) + 1)
+            if lo >= hi:
+                continue
 
             # Compute profile
-            fi_tensor = torch.full_like(i, fi)
-            bwi_tensor = torch.full_like(i, bwi)
-            profile_values = profile(normalized_freq - fi_tensor, bwi_tensor)
+            profile_values = profile(normalized_freq[lo:hi] - fi, bwi)
 
             # Update frequency amplitude
-            freq_amp += profile_values * A[nh]
+            freq_amp[lo:hi] += profile_values * A[nh]
 
-        # Construct complex frequency domain tensor
-        real = freq_amp * torch.cos(freq_phase)
-        imag = freq_amp * torch.sin(freq_phase)
-        freq_complex = torch.complex(real, imag)  # Shape: (N//2,)
+        # Construct complex frequency domain tensor straight from the real
+        # amplitudes and phases, no separate real/imag buffers
+        freq_complex = torch.polar(freq_amp, freq_phase)  # Shape: (N//2,)
 
         # Perform IFFT using torch.fft.irfft
         smp = torch.fft.irfft(freq_complex, n=N)  # Shape: (N,)
 
         # Normalize the signal to prevent clipping
-        max_val = torch.max(torch.abs(smp))
-        if max_val < 1e-5:
-            max_val = 1e-5  # Prevent division by zero
+        # Peak via a single inf-norm reduction, clamped to prevent division by zero
+        max_val = torch.linalg.vector_norm(smp, ord=math.inf).clamp_min(1e-5)
         smp = smp / (max_val * math.sqrt(2))  # Normalize to 1/sqrt(2) as in C++ code
 
         # Convert to float32 for saving
@@ -74,6 +74,15 @@ class SignalProcessingPadSynthChoir:
 
         audios = []
 
+        # Choir formants (center Hz, width Hz, weight) as in the C++ code
+        formant_centers = torch.tensor(
+            [600.0, 900.0, 2200.0, 2600.0, 0.0], dtype=torch.double
+        )
+        formant_widths = torch.tensor(
+            [150.0, 250.0, 200.0, 250.0, 3000.0], dtype=torch.double
+        )
+        formant_weights = torch.tensor([1.0, 1.0, 1.0, 1.0, 0.1], dtype=torch.double)
+
         for note_index in range(num_notes):
             note_semitones = step_size * note_index
             f1 = base_freq * (2.0 ** (note_semitones / 12.0))
@@ -82,18 +91,14 @@ class SignalProcessingPadSynthChoir:
             A = torch.zeros(number_harmonics, dtype=torch.double)
             A[0] = 0.0  # A[0] is not used
 
-            for i in range(1, number_harmonics):
-                # Calculate formants based on the C++ choir implementation
-                formants = (
-                    math.exp(-(((i * f1 - 600.0) / 150.0) ** 2))
-                    + math.exp(-(((i * f1 - 900.0) / 250.0) ** 2))
-                    + math.exp(-(((i * f1 - 2200.0) / 200.0) ** 2))
-                    + math.exp(-(((i * f1 - 2600.0) / 250.0) ** 2))
-                    + math.exp(-(((i * f1) / 3000.0) ** 2)) * 0.1
-                )
-                A[i] = (1.0 / i) * formants
-                # Optionally, you can debug amplitude values
-                # logger.debug(f"Harmonic {i}: A[{i}]={A[i]:.4f}")
+            # Calculate formants based on the C++ choir implementation,
+            # evaluating every (formant, harmonic) pair in one pass: [5, H-1]
+            harmonics = torch.arange(1, number_harmonics, dtype=torch.double)
+            harmonic_freqs = harmonics * f1
+            offsets = harmonic_freqs[None, :] - formant_centers[:, None]
+            x = offsets / formant_widths[:, None]
+            formants = (formant_weights[:, None] * torch.exp(-(x**2))).sum(dim=0)
+            A[1:] = formants / harmonics
 
             # Initialize frequency amplitude and phase arrays
             freq_amp = torch.zeros(N // 2, dtype=torch.double)
@@ -102,15 +107,18 @@ class SignalProcessingPadSynthChoir:
             )  # Random phases between 0 and 2pi
 
             # Define Gaussian profile function
-            def profile(fi: torch.Tensor, bwi: torch.Tensor) -> torch.Tensor:
+            def profile(fi: torch.Tensor, bwi: float) -> torch.Tensor:
                 x = fi / bwi
                 x_sq = x**2
                 # Avoid computing exp(-x^2) for x_sq > 14.71280603
                 mask = x_sq <= 14.71280603
                 result = torch.zeros_like(x_sq)
-                result[mask] = torch.exp(-x_sq[mask]) / bwi[mask]
+                result[mask] = torch.exp(-x_sq[mask]) / bwi
                 return result
 
+            # Half width of the profile support in units of bwi, sqrt(14.71280603)
+            profile_extent = math.sqrt(14.71280603)
+
             # Convert bandwidth from cents to Hz
             # bw_Hz = (2^(bw/1200) -1) * f * nh
             bw_multiplier = 2.0 ** (bandwidth_cents / 1200.0) - 1.0
@@ -126,25 +134,29 @@ class SignalProcessingPadSynthChoir:
                 bwi = bw_Hz / (2.0 * samplerate)
                 fi = f_nh / samplerate  # Normalized frequency
 
-                fi_tensor = torch.full_like(i, fi)
-                bwi_tensor = torch.full_like(i, bwi)
-                profile_values = profile(normalized_freq - fi_tensor, bwi_tensor)
+                # The profile is zero outside |x| <= profile_extent, only evaluate
+                # it on the bins inside that band
+                lo = max(0, math.floor((fi - profile_extent * bwi) * N))
+                hi = min(N // 2, math.ceil((fi + profile_extent * bwi) * N) + 1)
+                if lo >= hi:
+                    continue
+
+                # Compute profile
+                profile_values = profile(normalized_freq[lo:hi] - fi, bwi)
 
                 # Update frequency amplitude
-                freq_amp += profile_values * A[nh]
+                freq_amp[lo:hi] += profile_values * A[nh]
 
-            # Construct complex frequency domain tensor
-            real = freq_amp * torch.cos(freq_phase)
-            imag = freq_amp * torch.sin(freq_phase)
-            freq_complex = torch.complex(real, imag)  # Shape: (N//2,)
+            # Construct complex frequency domain tensor straight from the real
+            # amplitudes and phases, no separate real/imag buffers
+            freq_complex = torch.polar(freq_amp, freq_phase)  # Shape: (N//2,)
 
             # Perform IFFT using torch.fft.irfft
             smp = torch.fft.irfft(freq_complex, n=N)  # Shape: (N,)
 
             # Normalize the signal to prevent clipping
-            max_val = torch.max(torch.abs(smp))
-            if max_val < 1e-5:
-                max_val = 1e-5  # Prevent division by zero
+            # Peak via a single inf-norm reduction, clamped to prevent division by zero
+            max_val = torch.linalg.vector_norm(smp, ord=math.inf).clamp_min(1e-5)
             smp = smp / (
                 max_val * math.sqrt(2)
             )  # Normalize to 1/sqrt(2) as in C++ code
@@ -44,30 +44,38 @@ class SignalProcessingBaxandallEQ:
     FUNCTION = "process"
 
     def process(self, audio_input, bass_gain_db=0.0, treble_gain_db=0.0):
+        # Conditional processing: 0 dB shelves are identity filters
+        if bass_gain_db == 0.0 and treble_gain_db == 0.0:
+            return audio_to_comfy_3d(
+                audio_input["waveform"], audio_input["sample_rate"]
+            )
+
         waveform, sample_rate = audio_from_comfy_3d(audio_input, try_gpu=True)
         loudness = get_loudness(waveform, sample_rate)
 
         # Apply Bass Shelf (low shelf) using RBJ formula
-        b_bass, a_bass = self.design_rbj_shelf(
-            sample_rate, freq=100.0, gain_db=bass_gain_db, shelf_type="low"
-        )
-        waveform = torchaudio.functional.lfilter(
-            waveform,
-            a_bass.to(waveform.device),
-            b_bass.to(waveform.device),
-            clamp=False,
-        )
+        if bass_gain_db != 0.0:
+            b_bass, a_bass = self.design_rbj_shelf(
+                sample_rate, freq=100.0, gain_db=bass_gain_db, shelf_type="low"
+            )
+            waveform = torchaudio.functional.lfilter(
+                waveform,
+                a_bass.to(waveform.device),
+                b_bass.to(waveform.device),
+                clamp=False,
+            )
 
         # Apply Treble Shelf (high shelf) using RBJ formula
-        b_treble, a_treble = self.design_rbj_shelf(
-            sample_rate, freq=10000.0, gain_db=treble_gain_db, shelf_type="high"
-        )
-        waveform = torchaudio.functional.lfilter(
-            waveform,
-            a_treble.to(waveform.device),
-            b_treble.to(waveform.device),
-            clamp=False,
-        )
+        if treble_gain_db != 0.0:
+            b_treble, a_treble = self.design_rbj_shelf(
+                sample_rate, freq=10000.0, gain_db=treble_gain_db, shelf_type="high"
+            )
+            waveform = torchaudio.functional.lfilter(
+                waveform,
+                a_treble.to(waveform.device),
+                b_treble.to(waveform.device),
+                clamp=False,
+            )
 
         waveform = lufs_normalization(waveform, sample_rate, loudness)
         return audio_to_comfy_3d(waveform, sample_rate)
@@ -155,32 +163,49 @@ class SignalProcessingBaxandall3BandEQ:
         mid_q: float = 0.7,
     ):
 
+        # Conditional processing: 0 dB bands are identity filters
+        if bass_gain_db == 0.0 and mid_gain_db == 0.0 and treble_gain_db == 0.0:
+            return audio_to_comfy_3d(
+                audio_input["waveform"], audio_input["sample_rate"]
+            )
+
         waveform, sample_rate = audio_from_comfy_3d(audio_input, try_gpu=True)
         device = waveform.device
         dtype = waveform.dtype
         loudness = get_loudness(waveform, sample_rate)
 
         # Low shelf filter
-        b_low, a_low = self.design_rbj_shelf(
-            sample_rate, low_freq, bass_gain_db, shelf_type="low"
-        )
-        b_low = b_low.to(device=device, dtype=dtype)
-        a_low = a_low.to(device=device, dtype=dtype)
-        waveform = torchaudio.functional.lfilter(waveform, a_low, b_low, clamp=False)
+        if bass_gain_db != 0.0:
+            b_low, a_low = self.design_rbj_shelf(
+                sample_rate, low_freq, bass_gain_db, shelf_type="low"
+            )
+            b_low = b_low.to(device=device, dtype=dtype)
+            a_low = a_low.to(device=device, dtype=dtype)
+            waveform = torchaudio.functional.lfilter(
+                waveform, a_low, b_low, clamp=False
+            )
 
         # Mid peaking filter
-        b_mid, a_mid = self.design_rbj_peak(sample_rate, mid_freq, mid_gain_db, Q=mid_q)
-        b_mid = b_mid.to(device=device, dtype=dtype)
-        a_mid = a_mid.to(device=device, dtype=dtype)
-        waveform = torchaudio.functional.lfilter(waveform, a_mid, b_mid, clamp=False)
+        if mid_gain_db != 0.0:
+            b_mid, a_mid = self.design_rbj_peak(
+                sample_rate, mid_freq, mid_gain_db, Q=mid_q
+            )
+            b_mid = b_mid.to(device=device, dtype=dtype)
+            a_mid = a_mid.to(device=device, dtype=dtype)
+            waveform = torchaudio.functional.lfilter(
+                waveform, a_mid, b_mid, clamp=False
+            )
 
         # High shelf filter
-        b_high, a_high = self.design_rbj_shelf(
-            sample_rate, high_freq, treble_gain_db, shelf_type="high"
-        )
-        b_high = b_high.to(device=device, dtype=dtype)
-        a_high = a_high.to(device=device, dtype=dtype)
-        waveform = torchaudio.functional.lfilter(waveform, a_high, b_high, clamp=False)
+        if treble_gain_db != 0.0:
+            b_high, a_high = self.design_rbj_shelf(
+                sample_rate, high_freq, treble_gain_db, shelf_type="high"
+            )
+            b_high = b_high.to(device=device, dtype=dtype)
+            a_high = a_high.to(device=device, dtype=dtype)
+            waveform = torchaudio.functional.lfilter(
+                waveform, a_high, b_high, clamp=False
+            )
 
         # Normalize loudness after EQ
         waveform = lufs_normalization(waveform, sample_rate, loudness)